@@ -14,5 +14,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from .diagnostics import MotorDiagnosticResult, diagnose_motor, diagnose_motor_bus
+from .diagnostics import (
+    MotorDiagnosticBatch,
+    MotorDiagnosticResult,
+    diagnose_gripper_calibration,
+    diagnose_gripper_calibration_async,
+    diagnose_motor,
+    diagnose_motor_bus,
+)
 from .motors_bus import Motor, MotorCalibration, MotorNormMode, MotorsBus
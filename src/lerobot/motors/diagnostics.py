@@ -16,14 +16,29 @@
 Diagnostic utilities for motor calibration troubleshooting.
 """
 
+import asyncio
+import concurrent.futures
+import contextlib
 import logging
+import os
+import statistics
+import sys
+import threading
+from collections import deque
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Any
 
-from lerobot.motors.motors_bus import MotorsBus
+import numpy as np
+
+from lerobot.motors.motors_bus import MotorsBus, Value
 
 logger = logging.getLogger(__name__)
 
+_RULE = "=" * 60
+# Number of reads whose median is taken at each calibration checkpoint
+_BURST_SIZE = 5
+
 
 @dataclass
 class MotorDiagnosticResult:
@@ -46,7 +61,329 @@ class MotorDiagnosticResult:
             self.errors = []
 
 
-def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) -> MotorDiagnosticResult:
+def _optional_float(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass(eq=False)
+class MotorDiagnosticBatch:
+    """
+    Diagnostic results of several motors, stored as parallel arrays aligned on `names`.
+
+    Aggregates over the bus (failing motors, range statistics, out-of-range masks) are computed on whole
+    arrays. Use `per_motor()` to get the equivalent `MotorDiagnosticResult` of each motor. Positions that were
+    not recorded are stored as NaN.
+    """
+
+    names: list[str]
+    zero: np.ndarray
+    max_: np.ndarray
+    range_: np.ndarray
+    healthy: np.ndarray
+    readable: np.ndarray
+    warnings: list[list[str]]
+    errors: list[list[str]]
+
+    @classmethod
+    def from_results(cls, results: list[MotorDiagnosticResult]) -> "MotorDiagnosticBatch":
+        """Build a batch from per-motor results. The warnings/errors lists are shared, not copied."""
+
+        def positions(attr: str) -> np.ndarray:
+            values = [getattr(r, attr) for r in results]
+            return np.asarray([np.nan if v is None else v for v in values], dtype=np.float32)
+
+        return cls(
+            names=[r.motor_name for r in results],
+            zero=positions("zero_position"),
+            max_=positions("max_position"),
+            range_=np.asarray([r.position_range for r in results], dtype=np.float32),
+            healthy=np.asarray([r.healthy for r in results], dtype=bool),
+            readable=np.asarray([r.position_readable for r in results], dtype=bool),
+            warnings=[r.warnings for r in results],
+            errors=[r.errors for r in results],
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def all_healthy(self) -> bool:
+        return bool(self.healthy.all())
+
+    def per_motor(self) -> dict[str, MotorDiagnosticResult]:
+        """Return the results as a dictionary mapping motor names to `MotorDiagnosticResult`."""
+        return {
+            name: MotorDiagnosticResult(
+                motor_name=name,
+                healthy=bool(self.healthy[idx]),
+                position_readable=bool(self.readable[idx]),
+                position_changes=bool(self.range_[idx] > 0),
+                position_range=float(self.range_[idx]),
+                zero_position=_optional_float(self.zero[idx]),
+                max_position=_optional_float(self.max_[idx]),
+                warnings=self.warnings[idx],
+                errors=self.errors[idx],
+            )
+            for idx, name in enumerate(self.names)
+        }
+
+
+def _latency_timer_path(port: str) -> Path:
+    """Return the sysfs `latency_timer` node of the USB-serial adapter behind `port` (Linux only)."""
+    tty_name = Path(os.path.realpath(port)).name
+    return Path("/sys/bus/usb-serial/devices") / tty_name / "latency_timer"
+
+
+def read_latency_timer(port: str) -> int | None:
+    """
+    Read the `latency_timer` of the USB-serial adapter behind `port`.
+
+    Args:
+        port: Serial port of the motor bus
+
+    Returns:
+        The latency timer in milliseconds, or None if it is not exposed (non-Linux, non-FTDI adapter...)
+    """
+    try:
+        return int(_latency_timer_path(port).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def enable_low_latency(bus: MotorsBus) -> bool:
+    """
+    Switch the serial port of a connected motor bus to low-latency mode.
+
+    USB-serial adapters hold incoming bytes for up to 16 ms by default before handing them to the host, which
+    dominates the round-trip time of the small status packets returned by the motors. This sets the
+    `ASYNC_LOW_LATENCY` flag on the port through pyserial and, on Linux, lowers the adapter's
+    `latency_timer` to 1 ms. Both steps are best-effort: unsupported adapters or platforms, and missing
+    permissions on the sysfs node, are logged and otherwise ignored.
+
+    Args:
+        bus: The connected motor bus
+
+    Returns:
+        True if at least one of the low-latency settings could be applied
+    """
+    enabled = False
+    ser = getattr(bus.port_handler, "ser", None)
+    try:
+        ser.set_low_latency_mode(True)
+        enabled = True
+    except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+        logger.debug(f"Could not set ASYNC_LOW_LATENCY on '{bus.port}': {e}")
+
+    if sys.platform.startswith("linux"):
+        try:
+            _latency_timer_path(bus.port).write_text("1")
+            enabled = True
+        except OSError as e:
+            logger.debug(f"Could not lower the latency_timer of '{bus.port}': {e}")
+
+    return enabled
+
+
+def read_positions(
+    bus: MotorsBus, motors: list[str] | None = None, normalize: bool = True
+) -> dict[str, Value]:
+    """
+    Read the present position of several motors at once.
+
+    Uses a single Sync Read packet when the bus protocol supports it and falls back to sequential reads
+    otherwise (e.g. Feetech protocol 1).
+
+    Args:
+        bus: The motor bus to read from
+        motors: List of motor names to read. If None, read all motors.
+        normalize: If False, return raw motor steps instead of calibrated values
+
+    Returns:
+        Dictionary mapping motor names to their present position
+    """
+    if motors is None:
+        motors = list(bus.motors)
+
+    try:
+        return bus.sync_read("Present_Position", motors, normalize=normalize)
+    except NotImplementedError:
+        pass
+
+    # Sequential fallback: bind the lookups once rather than on every iteration.
+    read = bus.read
+    names = tuple(motors)
+    positions = {}
+    for name in names:
+        positions[name] = read("Present_Position", name, normalize=normalize)
+    return positions
+
+
+def _sample(bus: MotorsBus, motor: str, n: int = _BURST_SIZE, normalize: bool = True) -> float:
+    """Return the median of a burst of `n` position reads, filtering out the servo's read-to-read jitter."""
+    read = bus.read
+    return statistics.median(read("Present_Position", motor, normalize=normalize) for _ in range(n))
+
+
+async def poll_positions(
+    bus: MotorsBus,
+    motor_name: str,
+    samples: deque,
+    stop_event: asyncio.Event,
+    period_s: float = 0.02,
+    normalize: bool = True,
+) -> Exception | None:
+    """
+    Append the present position of a motor to `samples` every `period_s` seconds until `stop_event` is set.
+
+    The bus is not thread-safe: nothing else may use it while the poller is running.
+
+    Args:
+        bus: The motor bus to read from
+        motor_name: Name of the motor to sample
+        samples: Buffer receiving the readings. Use a `deque(maxlen=...)` to keep only the latest ones.
+        stop_event: Event stopping the poller once set
+        period_s: Delay between two reads, in seconds
+        normalize: If False, sample raw motor steps instead of calibrated values
+
+    Returns:
+        The last read error, if any
+    """
+    error = None
+    while not stop_event.is_set():
+        try:
+            samples.append(bus.read("Present_Position", motor_name, normalize=normalize))
+        except Exception as e:
+            error = e
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop_event.wait(), timeout=period_s)
+    return error
+
+
+def _input_in_daemon_thread(prompt: str) -> concurrent.futures.Future:
+    """
+    Run `input(prompt)` in a daemon thread.
+
+    A thread blocked in `input()` cannot be interrupted. Unlike the workers of the default executor, which
+    are joined when the event loop shuts down, a daemon thread does not keep the process alive after Ctrl-C.
+    """
+    future = concurrent.futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(input(prompt))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="diagnostics-input", daemon=True).start()
+    return future
+
+
+async def prompt_and_sample(
+    bus: MotorsBus,
+    motor_name: str,
+    prompt: str,
+    num_samples: int = 10,
+    period_s: float = 0.02,
+    normalize: bool = True,
+) -> float:
+    """
+    Prompt the user and sample the motor position until ENTER is pressed.
+
+    While the user moves a motor, the serial port would otherwise sit idle, and a single read issued after
+    ENTER may land on the servo's settling oscillation. The blocking `input()` runs in a daemon thread
+    while `poll_positions` keeps the last `num_samples` readings on the event loop, and their median is
+    returned.
+
+    Example:
+        >>> zero_pos = await prompt_and_sample(bus, "gripper", "Close the gripper, then press ENTER...")
+
+    Args:
+        bus: The motor bus to read from
+        motor_name: Name of the motor to sample
+        prompt: Message displayed to the user
+        num_samples: Number of latest readings the median is computed over
+        period_s: Delay between two reads, in seconds
+        normalize: If False, sample raw motor steps instead of calibrated values
+
+    Returns:
+        Median of the latest readings
+
+    Raises:
+        RuntimeError: No position could be read while waiting for the user.
+    """
+    samples = deque(maxlen=num_samples)
+    stop_event = asyncio.Event()
+    poller = asyncio.create_task(poll_positions(bus, motor_name, samples, stop_event, period_s, normalize))
+    try:
+        await asyncio.wrap_future(_input_in_daemon_thread(prompt))
+    finally:
+        stop_event.set()
+        error = await poller
+
+    if len(samples) < _BURST_SIZE:
+        # ENTER was pressed before the poller collected enough readings: take a burst instead.
+        try:
+            return _sample(bus, motor_name, normalize=normalize)
+        except Exception as e:
+            if not samples:
+                raise RuntimeError(f"Could not read the position of '{motor_name}'") from error or e
+    return statistics.median(samples)
+
+
+def _check_calibration_formula(bus: MotorsBus, batch: MotorDiagnosticBatch) -> None:
+    """
+    Check where the present position of each motor falls once calibrated with its recorded zero/max positions.
+
+    All motors are read in one go and the calibrated values are computed as a single vectorized expression.
+    Motors whose value falls outside [-10, 110] % get a warning appended to their entry of the batch.
+
+    Args:
+        bus: The motor bus to read from
+        batch: Diagnostic results holding the recorded zero and max positions. Motors without a valid
+            position range are skipped.
+    """
+    (indices,) = np.nonzero(batch.range_ > 0)
+    if indices.size == 0:
+        return
+
+    names = [batch.names[idx] for idx in indices]
+    try:
+        current = read_positions(bus, names)
+    except Exception as e:
+        logger.warning(f"⚠ Could not test calibration formula: {e}")
+        return
+
+    zeros = batch.zero[indices]
+    diffs = batch.range_[indices]
+    tests = np.asarray([current[name] for name in names], dtype=np.float32)
+
+    calib = (tests - zeros) / np.where(diffs == 0, 1, diffs) * 100.0
+    bad = (calib < -10) | (calib > 110)
+
+    logger.info("\nTesting calibration formula:")
+    for idx, name, value in zip(indices, names, calib, strict=True):
+        logger.info(
+            f"  {name}: zero {batch.zero[idx]:g}, max {batch.max_[idx]:g}, range {batch.range_[idx]:g}"
+            f" | current position {current[name]} → calibrated value: {value:.2f}%"
+        )
+
+    for pos in np.nonzero(bad)[0]:
+        name, value = names[pos], calib[pos]
+        batch.warnings[indices[pos]].append(
+            f"Current position calibrates to {value:.2f}% (outside normal range [-10, 110])"
+        )
+        logger.warning(f"⚠ {name}: current calibrated value {value:.2f}% is outside acceptable range")
+
+
+def diagnose_motor(
+    bus: MotorsBus,
+    motor_name: str,
+    interactive: bool = True,
+    initial_pos: Value | None = None,
+    test_formula: bool = True,
+) -> MotorDiagnosticResult:
     """
     Diagnose a single motor for calibration issues.
 
@@ -54,6 +391,9 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
         bus: The motor bus to test
         motor_name: Name of the motor to diagnose
         interactive: If True, prompt user to move the motor
+        initial_pos: Position already read for this motor (e.g. by a Sync Read). If None, it is read here.
+        test_formula: If True, check the calibration formula on the present position once zero and max
+            positions are recorded. `diagnose_motor_bus` disables this to run the check on all motors at once.
 
     Returns:
         MotorDiagnosticResult with diagnostic information
@@ -66,13 +406,12 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
         position_range=0.0,
     )
 
-    logger.info(f"\n{'='*60}")
-    logger.info(f"Diagnosing motor: {motor_name}")
-    logger.info(f"{'='*60}")
+    logger.info("\n%s\nDiagnosing motor: %s\n%s", _RULE, motor_name, _RULE)
 
     # Test 1: Check if motor position is readable
     try:
-        initial_pos = bus.read("Present_Position", motor_name)
+        if initial_pos is None:
+            initial_pos = bus.read("Present_Position", motor_name)
         result.position_readable = True
         logger.info(f"✓ Motor {motor_name} is readable. Current position: {initial_pos}")
     except Exception as e:
@@ -87,7 +426,7 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
     # Test 2: Check if position changes when motor is moved (zero position)
     input(f"\nMove '{motor_name}' to its MINIMUM/ZERO position (e.g., fully closed for gripper), then press ENTER...")
     try:
-        zero_pos = bus.read("Present_Position", motor_name)
+        zero_pos = _sample(bus, motor_name)
         result.zero_position = zero_pos
         logger.info(f"Zero position recorded: {zero_pos}")
     except Exception as e:
@@ -99,7 +438,7 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
     # Test 3: Check maximum position
     input(f"\nMove '{motor_name}' to its MAXIMUM position (e.g., fully open for gripper), then press ENTER...")
     try:
-        max_pos = bus.read("Present_Position", motor_name)
+        max_pos = _sample(bus, motor_name)
         result.max_position = max_pos
         logger.info(f"Maximum position recorded: {max_pos}")
     except Exception as e:
@@ -137,8 +476,8 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
         result.position_changes = True
 
     # Test calibration formula
-    if position_diff > 0:
-        logger.info(f"\nTesting calibration formula:")
+    if test_formula and position_diff > 0:
+        logger.info("\nTesting calibration formula:")
         logger.info(f"  Zero position: {zero_pos}")
         logger.info(f"  Max position: {max_pos}")
         logger.info(f"  Range: {position_diff}")
@@ -153,9 +492,7 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
                 result.warnings.append(
                     f"Current position calibrates to {calib_value:.2f}% (outside normal range [-10, 110])"
                 )
-                logger.warning(
-                    f"⚠ Current calibrated value {calib_value:.2f}% is outside acceptable range"
-                )
+                logger.warning(f"⚠ Current calibrated value {calib_value:.2f}% is outside acceptable range")
         except Exception as e:
             logger.warning(f"⚠ Could not test calibration formula: {e}")
 
@@ -163,8 +500,8 @@ def diagnose_motor(bus: MotorsBus, motor_name: str, interactive: bool = True) ->
 
 
 def diagnose_motor_bus(
-    bus: MotorsBus, motors: list[str] | None = None, interactive: bool = True
-) -> dict[str, MotorDiagnosticResult]:
+    bus: MotorsBus, motors: list[str] | None = None, interactive: bool = True, low_latency: bool = False
+) -> MotorDiagnosticBatch:
     """
     Run diagnostics on multiple motors.
 
@@ -172,39 +509,208 @@ def diagnose_motor_bus(
         bus: The motor bus to test
         motors: List of motor names to test. If None, test all motors.
         interactive: If True, prompt user to move motors
+        low_latency: If True, call `enable_low_latency` on the bus first. Off by default since, when run with
+            enough permissions, it lowers the adapter's `latency_timer` system-wide until it is replugged.
 
     Returns:
-        Dictionary mapping motor names to diagnostic results
+        MotorDiagnosticBatch with the results of all motors. Use `.per_motor()` to get a dictionary mapping
+        motor names to `MotorDiagnosticResult`.
     """
     if motors is None:
         motors = list(bus.motors.keys())
 
-    results = {}
-    for motor_name in motors:
-        results[motor_name] = diagnose_motor(bus, motor_name, interactive)
+    if low_latency:
+        enable_low_latency(bus)
+
+    latency_ms = read_latency_timer(bus.port)
+    if latency_ms is not None and latency_ms > 1:
+        logger.warning(
+            f"⚠ Serial latency_timer is {latency_ms} ms; "
+            f"set it to 1 for up to ~{latency_ms}x faster motor reads:"
+            f"\n   echo 1 | sudo tee {_latency_timer_path(bus.port)}"
+        )
+
+    # Read every motor in one transaction. On failure, each motor is read again on its own so that the error
+    # is reported against the faulty motor.
+    try:
+        initial_positions = read_positions(bus, motors)
+    except Exception as e:
+        logger.warning(f"⚠ Could not read all motors at once, reading them one by one: {e}")
+        initial_positions = {}
+
+    batch = MotorDiagnosticBatch.from_results(
+        [
+            diagnose_motor(
+                bus,
+                motor_name,
+                interactive,
+                initial_pos=initial_positions.get(motor_name),
+                test_formula=False,
+            )
+            for motor_name in motors
+        ]
+    )
+
+    if interactive:
+        _check_calibration_formula(bus, batch)
 
     # Print summary
-    logger.info(f"\n{'='*60}")
-    logger.info("DIAGNOSTIC SUMMARY")
-    logger.info(f"{'='*60}")
+    logger.info("\n%s\nDIAGNOSTIC SUMMARY\n%s", _RULE, _RULE)
 
-    all_healthy = True
-    for motor_name, result in results.items():
-        status = "✓ PASS" if result.healthy else "✗ FAIL"
+    for idx, motor_name in enumerate(batch.names):
+        status = "✓ PASS" if batch.healthy[idx] else "✗ FAIL"
         logger.info(f"{motor_name}: {status}")
 
-        if result.errors:
-            for error in result.errors:
-                logger.error(f"  ERROR: {error}")
-            all_healthy = False
+        for error in batch.errors[idx]:
+            logger.error(f"  ERROR: {error}")
 
-        if result.warnings:
-            for warning in result.warnings:
-                logger.warning(f"  WARNING: {warning}")
+        for warning in batch.warnings[idx]:
+            logger.warning(f"  WARNING: {warning}")
 
-    if all_healthy:
+    if batch.all_healthy:
         logger.info("\n✓ All motors passed diagnostics. You can proceed with calibration.")
     else:
         logger.error("\n✗ Some motors failed diagnostics. Please fix the issues before calibrating.")
 
-    return results
+    return batch
+
+
+def diagnose_gripper_calibration(
+    bus: MotorsBus, motor_name: str = "gripper", num_tests: int = 3, interactive: bool = True
+) -> MotorDiagnosticResult:
+    """
+    Synchronous version of `diagnose_gripper_calibration_async`.
+
+    The whole walkthrough runs on a single event loop. When called from a running event loop (e.g. in a
+    Jupyter notebook), that loop is run in a separate thread; prefer awaiting
+    `diagnose_gripper_calibration_async` directly there.
+    """
+    coro = diagnose_gripper_calibration_async(bus, motor_name, num_tests, interactive)
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+async def diagnose_gripper_calibration_async(
+    bus: MotorsBus, motor_name: str = "gripper", num_tests: int = 3, interactive: bool = True
+) -> MotorDiagnosticResult:
+    """
+    Walk through the calibration of a single motor step by step to find out why it fails.
+
+    The motor is sampled at its zero (fully closed) and rotated (fully open) positions, then at `num_tests`
+    other positions whose calibrated value is checked against the [-10, 110] % range accepted by the
+    calibration. Positions are read in raw motor steps so that this works on motors that are not calibrated.
+
+    Args:
+        bus: The connected motor bus
+        motor_name: Name of the motor to test
+        num_tests: Number of test positions checked against the calibration formula
+        interactive: If False, only check that the positions of all motors can be read
+
+    Returns:
+        MotorDiagnosticResult where `zero_position` and `max_position` hold the zero and rotated positions
+    """
+    result = MotorDiagnosticResult(
+        motor_name=motor_name,
+        healthy=True,
+        position_readable=False,
+        position_changes=False,
+        position_range=0.0,
+    )
+
+    logger.info("\n%s\nDebugging calibration of motor: %s\n%s", _RULE, motor_name, _RULE)
+
+    try:
+        positions = read_positions(bus, normalize=False)
+    except Exception as e:
+        result.healthy = False
+        result.errors.append(f"Cannot read motor positions: {e}")
+        logger.error(f"✗ Cannot read motor positions: {e}")
+        return result
+
+    result.position_readable = True
+    logger.info("Current positions:")
+    for name, position in positions.items():
+        logger.info(f"  {name}: {position}")
+
+    if not interactive:
+        return result
+
+    try:
+        bus.write("Torque_Enable", motor_name, 1)
+    except Exception as e:
+        result.warnings.append(f"Cannot enable torque: {e}")
+        logger.warning(f"⚠ Cannot enable torque on {motor_name}: {e}")
+
+    try:
+        zero_pos = await prompt_and_sample(
+            bus,
+            motor_name,
+            f"\nMove '{motor_name}' to its ZERO position (fully closed), then press ENTER...",
+            normalize=False,
+        )
+        logger.info(f"Zero position recorded: {zero_pos}")
+        rotated_pos = await prompt_and_sample(
+            bus,
+            motor_name,
+            f"\nMove '{motor_name}' to its ROTATED position (fully open), then press ENTER...",
+            normalize=False,
+        )
+        logger.info(f"Rotated position recorded: {rotated_pos}")
+    except Exception as e:
+        result.healthy = False
+        result.errors.append(f"Cannot read calibration position: {e}")
+        logger.error(f"✗ Cannot read calibration position: {e}")
+        return result
+
+    difference = rotated_pos - zero_pos
+    result.zero_position = zero_pos
+    result.max_position = rotated_pos
+    result.position_range = abs(difference)
+    result.position_changes = difference != 0
+    logger.info(f"Difference between positions: {difference}")
+
+    if difference == 0:
+        result.healthy = False
+        result.errors.append(
+            "Position did not change between zero and rotated positions! This will cause division by zero "
+            "during calibration."
+        )
+        logger.error("✗ CRITICAL: Zero position difference detected!")
+        return result
+    elif abs(difference) < 10:
+        result.warnings.append(
+            f"Very small position difference ({difference}). This may cause calibration issues."
+        )
+        logger.warning(f"⚠ Very small position difference: {difference}")
+    else:
+        logger.info("✓ Position difference looks acceptable.")
+
+    inv_diff = 100.0 / difference
+    prompts = [
+        f"\nTest {i + 1}/{num_tests}: Move '{motor_name}' to a different position, then press ENTER..."
+        for i in range(num_tests)
+    ]
+    for prompt in prompts:
+        try:
+            test_pos = await prompt_and_sample(bus, motor_name, prompt, normalize=False)
+        except Exception as e:
+            logger.warning(f"⚠ Could not read test position: {e}")
+            continue
+
+        calib_val = (test_pos - zero_pos) * inv_diff
+        logger.info(f"Position {test_pos} → calibrated value: {calib_val:.2f}%")
+        if not -10 <= calib_val <= 110:
+            result.warnings.append(
+                f"Position {test_pos} calibrates to {calib_val:.2f}% (outside normal range [-10, 110])"
+            )
+            logger.warning(
+                f"⚠ Calibrated value {calib_val:.2f}% is outside acceptable range. This would trigger the "
+                "'Wrong motor position range' error during calibration."
+            )
+
+    return result
@@ -13,6 +13,8 @@
 # limitations under the License.
 
 import logging
+import os
+import select
 from copy import deepcopy
 from enum import Enum
 from pprint import pformat
@@ -96,6 +98,21 @@ def patch_setPacketTimeout(self, packet_length):  # noqa: N802
     self.packet_timeout = (self.tx_time_per_byte * packet_length) + (self.tx_time_per_byte * 3.0) + 50
 
 
+def patch_readPort(self, length):  # noqa: N802
+    """
+    HACK: This patches the PortHandler behavior to wait for incoming bytes instead of busy-polling.
+
+    The SDK opens the serial port with `timeout=0` and spins on `readPort()` until the packet timeout expires.
+    Instead, block in `select()` on the port's file descriptor for at most the remaining packet timeout, then
+    read exactly what the driver has buffered (`in_waiting` queries `TIOCINQ`). Only valid on POSIX systems.
+    """
+    if not self.ser.in_waiting:
+        remaining_ms = self.packet_timeout - self.getTimeSinceStart()
+        if remaining_ms > 0:
+            select.select([self.ser.fileno()], [], [], remaining_ms / 1000.0)
+    return self.ser.read(min(length, self.ser.in_waiting))
+
+
 class FeetechMotorsBus(MotorsBus):
     """
     The FeetechMotorsBus class allows to efficiently read and write to the attached motors. It relies on the
@@ -130,6 +147,8 @@ class FeetechMotorsBus(MotorsBus):
         self.port_handler.setPacketTimeout = patch_setPacketTimeout.__get__(
             self.port_handler, scs.PortHandler
         )
+        if os.name == "posix":
+            self.port_handler.readPort = patch_readPort.__get__(self.port_handler, scs.PortHandler)
         self.packet_handler = scs.PacketHandler(protocol_version)
         self.sync_reader = scs.GroupSyncRead(self.port_handler, self.packet_handler, 0, 0)
         self.sync_writer = scs.GroupSyncWrite(self.port_handler, self.packet_handler, 0, 0)
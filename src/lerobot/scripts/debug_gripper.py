@@ -4,132 +4,89 @@ Simplified debug script for the Feetech gripper calibration issue.
 This script isolates the gripper testing process to diagnose calibration errors.
 """
 
-import time
-from pathlib import Path
+import argparse
+import functools
+import logging
+import traceback
 
-from lerobot.motors.feetech import FeetechMotorsBus
-from lerobot.robots import make_robot_from_config
-from lerobot.robots.so100_follower.config_so100_follower import SO100FollowerConfig
+from lerobot.motors import MotorsBus
+from lerobot.motors.diagnostics import diagnose_gripper_calibration, enable_low_latency
+from lerobot.robots.so100_follower import SO100Follower, SO100FollowerConfig
+from lerobot.utils.utils import init_logging
 
-def debug_gripper():
-    """Test the gripper servo to diagnose calibration issues."""
-    print("Starting Feetech gripper debugging test...")
+logger = logging.getLogger(__name__)
 
-    # Configure and create SO100 follower robot
-    # Update the port to match your device
-    config = SO100FollowerConfig(
-        port="/dev/tty.usbmodem59700726961",  # Update this to your actual port
-        mock=False,
-    )
 
-    # Remove existing calibration file to force recalibration
-    calib_dir = Path(".cache/calibration/so100_follower")
-    calib_dir.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=1)
+def get_follower_bus(port: str) -> MotorsBus:
+    """
+    Return the (not yet connected) motor bus of an SO-100 follower arm connected on `port`.
+
+    The bus is taken from an `SO100Follower` that is never connected, so that its motor table has a single
+    definition and no calibration runs. The robot may load an existing calibration file, but the walkthrough
+    reads raw motor steps (`normalize=False`), so a stale calibration does not affect it. The bus object is
+    cached per port; the caller is responsible for connecting and disconnecting it.
+    """
+    return SO100Follower(SO100FollowerConfig(port=port)).bus
 
-    follower_calib = calib_dir / "calibration.json"
-    if follower_calib.exists():
-        print(f"Removing existing calibration file: {follower_calib}")
-        follower_calib.unlink()
 
-    # Create robot instance
-    print("Creating SO100 follower robot instance...")
-    robot = make_robot_from_config(config)
+def release_bus(bus: MotorsBus) -> None:
+    """
+    Disable torque on all motors and close the port of a connected bus.
 
+    Torque is disabled with a single Sync Write packet. Sync Write gets no status reply, so the torque state
+    is read back, and the bus's own acknowledged, retried per-motor torque-off runs if any motor still has
+    torque enabled or if anything failed. The port is closed in every case.
+    """
     try:
-        # Connect to the robot
-        print(f"Connecting to port: {config.port}")
-        robot.connect()
-
-        # Get the motor bus
-        bus = robot.bus
-
-        print("\nMotor IDs:")
-        for motor_name in bus.motors:
-            print(f"- {motor_name}")
-        
-        # Test all motors to verify communication
-        print("\nReading current positions for all motors:")
-        try:
-            for motor_name in bus.motors:
-                position = bus.read("Present_Position", motor_name)
-                print(f"- {motor_name}: {position}")
-        except Exception as e:
-            print(f"Error reading positions: {e}")
-
-        print("\nFocusing on gripper motor...")
-
-        # Enable torque
-        print("Enabling torque on gripper...")
-        try:
-            bus.write("Torque_Enable", "gripper", True)
-            print("Torque enabled successfully.")
-        except Exception as e:
-            print(f"Error enabling torque: {e}")
-        
-        # Debug calibration process step by step
-        print("\n--- CALIBRATION DEBUGGING ---")
-        
-        # Zero position
-        input("\nMove gripper to ZERO position (FULLY CLOSED), then press Enter...")
-        try:
-            zero_pos = bus.read("Present_Position", "gripper")
-            print(f"Zero position value: {zero_pos}")
-        except Exception as e:
-            print(f"Error reading zero position: {e}")
-            zero_pos = None
-
-        # Rotated position
-        input("\nMove gripper to ROTATED position (FULLY OPEN), then press Enter...")
-        try:
-            rotated_pos = bus.read("Present_Position", "gripper")
-            print(f"Rotated position value: {rotated_pos}")
-        except Exception as e:
-            print(f"Error reading rotated position: {e}")
-            rotated_pos = None
-        
-        # Check the critical difference
-        if zero_pos is not None and rotated_pos is not None:
-            difference = rotated_pos - zero_pos
-            print(f"\nDifference between positions: {difference}")
-            
-            if difference == 0:
-                print("ERROR: Zero difference detected! This will cause division by zero during calibration.")
-                print("The gripper position is not changing between calibration steps.")
-            elif abs(difference) < 10:
-                print(f"WARNING: Very small difference ({difference})! This might cause calibration issues.")
-            else:
-                print("Difference looks acceptable.")
-                
-            # Test calibration formula manually
-            print("\nTesting calibration formula...")
-            if difference != 0:
-                # Test with a few positions to check calibration
-                for i in range(3):
-                    input(f"\nTest {i+1}: Move gripper to a different position, then press Enter...")
-                    test_pos = bus.read("Present_Position", "gripper")
-                    print(f"Position value: {test_pos}")
-                    
-                    # Calculate what the calibrated value would be
-                    calib_val = (test_pos - zero_pos) / difference * 100
-                    print(f"This would calibrate to approximately: {calib_val:.2f}%")
-                    
-                    # Check if this value would cause the calibration error
-                    if calib_val < -10 or calib_val > 110:
-                        print(f"WARNING: This value ({calib_val:.2f}%) is outside the acceptable range [-10, 110]")
-                        print("This would trigger the 'Wrong motor position range' error during calibration.")
-        
+        bus.sync_write("Torque_Enable", 0)
+        torque_off = not any(bus.sync_read("Torque_Enable").values())
     except Exception as e:
-        print(f"Error during testing: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.warning("Could not disable torque with a Sync Write: %s", e)
+        torque_off = False
+
+    if torque_off:
+        bus.disconnect(disable_torque=False)
+        return
+
+    logger.warning("Disabling torque motor by motor.")
+    try:
+        bus.disconnect()
+    except Exception as e:
+        logger.error("Could not disable torque: %s", e)
+        bus.port_handler.closePort()
+
+
+def debug_gripper(port: str, verbose: bool = False) -> None:
+    """Test the gripper servo to diagnose calibration issues."""
+    bus = get_follower_bus(port)
+    try:
+        bus.connect()
+        enable_low_latency(bus)
+        diagnose_gripper_calibration(bus)
+    except Exception as e:
+        # The formatter installed by `init_logging` ignores `exc_info`, so the traceback goes in the message.
+        if verbose:
+            logger.error("Error during testing: %s\n%s", e, traceback.format_exc().rstrip())
+        else:
+            logger.error("Error during testing: %s", e)
     finally:
-        # Clean up
-        print("\nDisconnecting...")
-        try:
-            if robot.is_connected:
-                robot.disconnect()
-        except Exception as e:
-            print(f"Error disconnecting robot: {e}")
+        if bus.is_connected:
+            release_bus(bus)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--port", default="/dev/tty.usbmodem59700726961", help="Port of the SO100 follower arm."
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Log debug messages and the full traceback of errors."
+    )
+    args = parser.parse_args()
+    init_logging(console_level="DEBUG" if args.verbose else "INFO")
+    debug_gripper(args.port, args.verbose)
+
 
 if __name__ == "__main__":
-    debug_gripper()
+    main()
@@ -33,56 +33,158 @@ lerobot-calibrate \
 ```
 """
 
+import importlib
 import logging
-from dataclasses import asdict, dataclass
-from pprint import pformat
+import os
+import select
+import sys
+from dataclasses import dataclass, fields, is_dataclass
+from typing import Protocol, runtime_checkable
 
 import draccus
 
-from lerobot.cameras.opencv.configuration_opencv import OpenCVCameraConfig  # noqa: F401
-from lerobot.cameras.realsense.configuration_realsense import RealSenseCameraConfig  # noqa: F401
-from lerobot.robots import (  # noqa: F401
-    Robot,
-    RobotConfig,
-    hope_jr,
-    koch_follower,
-    lekiwi,
-    make_robot_from_config,
-    omx_follower,
-    so100_follower,
-    so101_follower,
-)
+from lerobot.configs.parser import get_type_arg
+from lerobot.robots import Robot, RobotConfig, make_robot_from_config  # noqa: F401
 from lerobot.teleoperators import (  # noqa: F401
     Teleoperator,
     TeleoperatorConfig,
-    homunculus,
-    koch_leader,
     make_teleoperator_from_config,
-    omx_leader,
-    so100_leader,
-    so101_leader,
 )
-from lerobot.utils.import_utils import register_third_party_plugins
+from lerobot.utils.import_utils import register_third_party_plugins_cached
 from lerobot.utils.utils import init_logging
 
+# Device type -> package registering its config. Only the package of the requested device is imported, so
+# that a calibration run does not pay for the import of every other backend.
+ROBOT_FAMILIES = {
+    "hope_jr_arm": "hope_jr",
+    "hope_jr_hand": "hope_jr",
+    "koch_follower": "koch_follower",
+    "lekiwi": "lekiwi",
+    "lekiwi_client": "lekiwi",
+    "omx_follower": "omx_follower",
+    "so100_follower": "so100_follower",
+    "so101_follower": "so101_follower",
+}
+TELEOP_FAMILIES = {
+    "homunculus_arm": "homunculus",
+    "homunculus_glove": "homunculus",
+    "koch_leader": "koch_leader",
+    "omx_leader": "omx_leader",
+    "so100_leader": "so100_leader",
+    "so101_leader": "so101_leader",
+}
+CAMERA_CONFIG_MODULES = (
+    "lerobot.cameras.opencv.configuration_opencv",
+    "lerobot.cameras.realsense.configuration_realsense",
+)
+
+
+def _has_arg(arg_name: str, args: list[str]) -> bool:
+    """Whether `--arg_name` (or one of its nested fields) is given, in either `--a=b` or `--a b` form."""
+    return any(arg == f"--{arg_name}" or arg.startswith((f"--{arg_name}=", f"--{arg_name}.")) for arg in args)
+
+
+def import_device_configs(args: list[str] | None = None) -> None:
+    """
+    Import the config modules needed by draccus to parse the command line.
+
+    The package of the requested robot/teleoperator type is imported. Every family is imported when the type
+    is unknown (e.g. a third-party device) or cannot be read from `--robot.type=...` (config file, `--help`,
+    space-separated `--robot.type so100_follower`), so that draccus can resolve it and list the available
+    choices. Camera configs are only imported when cameras may be configured.
+    """
+    if args is None:
+        args = sys.argv[1:]
+    import_all = _has_arg("config_path", args) or any(arg in ("-h", "--help") for arg in args)
+
+    for field_name, package, families in (
+        ("robot", "lerobot.robots", ROBOT_FAMILIES),
+        ("teleop", "lerobot.teleoperators", TELEOP_FAMILIES),
+    ):
+        device_type = get_type_arg(field_name, args)
+        if device_type in families and not import_all:
+            modules = {families[device_type]}
+        elif device_type is not None or import_all or _has_arg(field_name, args):
+            modules = set(families.values())
+        else:
+            continue
+        for module in sorted(modules):
+            importlib.import_module(f"{package}.{module}")
+
+    if import_all or any(".cameras" in arg for arg in args):
+        for module in CAMERA_CONFIG_MODULES:
+            importlib.import_module(module)
+
+
+@runtime_checkable
+class _HasBus(Protocol):
+    """Device exposing a motor bus, which is what `--diagnose` runs on."""
+
+    bus: object
+
 
 @dataclass
 class CalibrateConfig:
     teleop: TeleoperatorConfig | None = None
     robot: RobotConfig | None = None
     diagnose: bool = False  # Run diagnostics instead of calibration
+    # Seconds to wait for an answer to the "proceed with calibration?" prompt of `--diagnose` before aborting
+    # and releasing the device. None waits forever.
+    diagnose_prompt_timeout: float | None = 60.0
 
     def __post_init__(self):
-        if bool(self.teleop) == bool(self.robot):
+        has_robot = self.robot is not None
+        if has_robot == (self.teleop is not None):
             raise ValueError("Choose either a teleop or a robot.")
 
-        self.device = self.robot if self.robot else self.teleop
+        self.device = self.robot if has_robot else self.teleop
+
+
+def _format_cfg(cfg: object, indent: int = 0) -> str:
+    """Format a config one field per line, recursing into nested dataclasses without copying them."""
+    pad = "  " * indent
+    lines = []
+    for field in fields(cfg):
+        value = getattr(cfg, field.name)
+        if is_dataclass(value) and not isinstance(value, type):
+            lines.append(f"{pad}{field.name}: {type(value).__name__}")
+            nested = _format_cfg(value, indent + 1)
+            if nested:
+                lines.append(nested)
+        else:
+            lines.append(f"{pad}{field.name}: {value!r}")
+    return "\n".join(lines)
+
+
+def _input_with_timeout(prompt: str, timeout: float | None) -> str | None:
+    """
+    Like `input()`, but returns None if no line was entered within `timeout` seconds.
+
+    Only interactive terminals are waited on with `select()`: a pipe may already hold the answer in the
+    buffer of `sys.stdin`, which `select()` on the file descriptor does not see.
+    """
+    if timeout is None or os.name != "posix" or not sys.stdin.isatty():
+        return input(prompt)
+
+    print(prompt, end="", flush=True)
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        print()
+        return None
+    return sys.stdin.readline()
+
+
+def _info_enabled() -> bool:
+    """Whether an INFO record would be output. `init_logging` filters levels on the root handlers only."""
+    root = logging.getLogger()
+    return root.isEnabledFor(logging.INFO) and any(h.level <= logging.INFO for h in root.handlers)
 
 
 @draccus.wrap()
 def calibrate(cfg: CalibrateConfig):
     init_logging()
-    logging.info(pformat(asdict(cfg)))
+    if _info_enabled():
+        logging.info("%s", _format_cfg(cfg))
 
     if isinstance(cfg.device, RobotConfig):
         device = make_robot_from_config(cfg.device)
@@ -91,44 +193,50 @@ def calibrate(cfg: CalibrateConfig):
 
     device.connect(calibrate=False)
 
-    if cfg.diagnose:
-        # Run diagnostics instead of calibration
-        if not hasattr(device, "bus"):
-            logging.error("This device does not have a motor bus. Diagnostics are not supported.")
-            device.disconnect()
-            return
-
-        from lerobot.motors.diagnostics import diagnose_motor_bus
-
-        logging.info("\n" + "=" * 60)
-        logging.info("Running motor diagnostics...")
-        logging.info("=" * 60)
-
-        # Run diagnostics on all motors
-        results = diagnose_motor_bus(device.bus, interactive=True)
-
-        # Ask if user wants to proceed with calibration
-        all_healthy = all(r.healthy for r in results.values())
-        if all_healthy:
-            user_input = input(
-                "\n✓ Diagnostics passed! Would you like to proceed with calibration? (y/n): "
-            )
-            if user_input.strip().lower() == "y":
-                logging.info("Proceeding with calibration...")
-                device.calibrate()
+    try:
+        if cfg.diagnose:
+            # Run diagnostics instead of calibration
+            if not isinstance(device, _HasBus):
+                logging.error("This device does not have a motor bus. Diagnostics are not supported.")
+                return
+
+            from lerobot.motors.diagnostics import diagnose_motor_bus
+
+            logging.info("\n" + "=" * 60)
+            logging.info("Running motor diagnostics...")
+            logging.info("=" * 60)
+
+            # Run diagnostics on all motors
+            results = diagnose_motor_bus(device.bus, interactive=True)
+
+            # Ask if user wants to proceed with calibration
+            if results.all_healthy:
+                user_input = _input_with_timeout(
+                    "\n✓ Diagnostics passed! Would you like to proceed with calibration? (y/n): ",
+                    cfg.diagnose_prompt_timeout,
+                )
+                if user_input is None:
+                    logging.warning(
+                        f"No answer within {cfg.diagnose_prompt_timeout}s. "
+                        "Aborting calibration and disconnecting."
+                    )
+                elif user_input.strip().lower() == "y":
+                    logging.info("Proceeding with calibration...")
+                    device.calibrate()
+            else:
+                logging.error(
+                    "\n✗ Diagnostics failed. Please fix the issues above before attempting calibration."
+                )
         else:
-            logging.error(
-                "\n✗ Diagnostics failed. Please fix the issues above before attempting calibration."
-            )
-    else:
-        # Normal calibration workflow
-        device.calibrate()
-
-    device.disconnect()
+            # Normal calibration workflow
+            device.calibrate()
+    finally:
+        device.disconnect()
 
 
 def main():
-    register_third_party_plugins()
+    register_third_party_plugins_cached()
+    import_device_configs()
     calibrate()
 
 
@@ -13,13 +13,27 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import hashlib
 import importlib
 import importlib.metadata
+import json
 import logging
+import os
+import sys
+from pathlib import Path
 from typing import Any
 
 from draccus.choice_types import ChoiceRegistry
 
+from lerobot.utils.constants import HF_LEROBOT_HOME
+
+THIRD_PARTY_PLUGIN_PREFIXES = (
+    "lerobot_robot_",
+    "lerobot_camera_",
+    "lerobot_teleoperator_",
+    "lerobot_policy_",
+)
+
 
 def is_package_available(pkg_name: str, return_version: bool = False) -> tuple[bool, str] | bool:
     """Copied from https://github.com/huggingface/transformers/blob/main/src/transformers/utils/import_utils.py
@@ -130,19 +144,21 @@ def make_device_from_device_class(config: ChoiceRegistry) -> Any:
     )
 
 
-def register_third_party_plugins() -> None:
-    """
-    Discover and import third-party LeRobot plugins so they can register themselves.
+def _discover_third_party_plugins() -> list[str]:
+    """Return the names of the installed distributions that are third-party LeRobot plugins."""
+    plugins = []
+    for dist in importlib.metadata.distributions():
+        dist_name = dist.metadata.get("Name")
+        if dist_name and dist_name.startswith(THIRD_PARTY_PLUGIN_PREFIXES):
+            plugins.append(dist_name)
+    return plugins
 
-    This function uses `importlib.metadata` to find packages installed in the environment
-    (including editable installs) starting with 'lerobot_robot_', 'lerobot_camera_',
-    'lerobot_teleoperator_', or 'lerobot_policy_' and imports them.
-    """
-    prefixes = ("lerobot_robot_", "lerobot_camera_", "lerobot_teleoperator_", "lerobot_policy_")
+
+def _import_third_party_plugins(module_names: list[str]) -> None:
     imported: list[str] = []
     failed: list[str] = []
 
-    def attempt_import(module_name: str):
+    for module_name in module_names:
         try:
             importlib.import_module(module_name)
             imported.append(module_name)
@@ -151,11 +167,55 @@ def register_third_party_plugins() -> None:
             logging.exception("Could not import third-party plugin: %s", module_name)
             failed.append(module_name)
 
-    for dist in importlib.metadata.distributions():
-        dist_name = dist.metadata.get("Name")
-        if not dist_name:
-            continue
-        if dist_name.startswith(prefixes):
-            attempt_import(dist_name)
-
     logging.debug("Third-party plugin import summary: imported=%s failed=%s", imported, failed)
+
+
+def register_third_party_plugins() -> None:
+    """
+    Discover and import third-party LeRobot plugins so they can register themselves.
+
+    This function uses `importlib.metadata` to find packages installed in the environment
+    (including editable installs) starting with 'lerobot_robot_', 'lerobot_camera_',
+    'lerobot_teleoperator_', or 'lerobot_policy_' and imports them.
+    """
+    _import_third_party_plugins(_discover_third_party_plugins())
+
+
+def _sys_path_fingerprint() -> str:
+    """Hash the directories of `sys.path` with their modification times, which change on (un)install."""
+    entries = tuple((p, os.stat(p).st_mtime_ns) for p in sys.path if os.path.isdir(p))
+    return hashlib.sha256(repr(entries).encode()).hexdigest()
+
+
+def register_third_party_plugins_cached(cache_path: Path | None = None) -> None:
+    """
+    Same as `register_third_party_plugins`, but reuses the plugin names found by a previous scan.
+
+    Scanning the metadata of every installed distribution is the slow part of plugin registration. The names
+    it finds are stored in a JSON cache keyed by the directories of `sys.path` and their modification times,
+    so the scan only runs again once a package has been installed or removed.
+
+    Args:
+        cache_path: Path of the cache file. Defaults to `$HF_LEROBOT_HOME/plugins.json`.
+    """
+    if cache_path is None:
+        cache_path = HF_LEROBOT_HOME / "plugins.json"
+    key = _sys_path_fingerprint()
+
+    plugins = None
+    try:
+        cache = json.loads(cache_path.read_text())
+        if cache["key"] == key:
+            plugins = cache["plugins"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if plugins is None:
+        plugins = _discover_third_party_plugins()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps({"key": key, "plugins": plugins}))
+        except OSError as e:
+            logging.debug("Could not write the third-party plugin cache %s: %s", cache_path, e)
+
+    _import_third_party_plugins(plugins)
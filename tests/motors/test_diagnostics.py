@@ -0,0 +1,269 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from lerobot.motors import MotorDiagnosticBatch, MotorDiagnosticResult
+from lerobot.motors.diagnostics import (
+    _check_calibration_formula,
+    _input_in_daemon_thread,
+    _sample,
+    diagnose_gripper_calibration,
+    diagnose_motor,
+    diagnose_motor_bus,
+    enable_low_latency,
+    prompt_and_sample,
+    read_latency_timer,
+    read_positions,
+)
+
+
+@pytest.fixture
+def results() -> list[MotorDiagnosticResult]:
+    return [
+        MotorDiagnosticResult("in_range", True, True, True, 1000.0, zero_position=1000, max_position=2000),
+        MotorDiagnosticResult(
+            "out_of_range", True, True, True, 1000.0, zero_position=1000, max_position=2000
+        ),
+        MotorDiagnosticResult("stuck", False, True, False, 0.0, zero_position=1500, max_position=1500),
+        MotorDiagnosticResult("unreadable", False, False, False, 0.0, errors=["Cannot read motor position"]),
+    ]
+
+
+def test_batch_per_motor_round_trip(results):
+    batch = MotorDiagnosticBatch.from_results(results)
+
+    assert len(batch) == 4
+    assert not batch.all_healthy
+    assert batch.per_motor() == {r.motor_name: r for r in results}
+    # Batches hold arrays, so they compare by identity instead of field by field
+    assert batch != MotorDiagnosticBatch.from_results(results)
+
+
+def test_check_calibration_formula(results):
+    bus = MagicMock()
+    bus.sync_read.return_value = {"in_range": 1500, "out_of_range": 5000}
+    batch = MotorDiagnosticBatch.from_results(results)
+
+    _check_calibration_formula(bus, batch)
+
+    bus.sync_read.assert_called_once_with("Present_Position", ["in_range", "out_of_range"], normalize=True)
+    assert batch.warnings[0] == []
+    assert batch.warnings[1] == ["Current position calibrates to 400.00% (outside normal range [-10, 110])"]
+    # Warnings are shared with the per-motor results the batch was built from
+    assert results[1].warnings is batch.warnings[1]
+
+
+def test_read_positions_sequential_fallback():
+    bus = MagicMock()
+    bus.motors = {"dummy_1": None, "dummy_2": None}
+    bus.sync_read.side_effect = NotImplementedError
+    bus.read.side_effect = lambda data_name, motor, normalize: {"dummy_1": 10, "dummy_2": 20}[motor]
+
+    assert read_positions(bus, normalize=False) == {"dummy_1": 10, "dummy_2": 20}
+    assert bus.read.call_count == 2
+
+
+def test_sample_median_of_burst():
+    bus = MagicMock()
+    bus.read.side_effect = [1000, 1003, 2000, 998, 1001]
+
+    assert _sample(bus, "gripper", n=5) == 1001
+    assert bus.read.call_count == 5
+
+
+def test_diagnose_motor_checks_formula_on_its_own_motor(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+    bus = MagicMock()
+    # Initial read, then bursts of reads at the zero and max positions, then the formula check
+    bus.read.side_effect = [1500] + [1000] * 5 + [2000] * 5 + [3500]
+
+    result = diagnose_motor(bus, "gripper")
+
+    assert result.healthy
+    assert result.position_range == 1000
+    assert result.warnings == ["Current position calibrates to 250.00% (outside normal range [-10, 110])"]
+    bus.sync_read.assert_not_called()
+
+
+def test_input_in_daemon_thread(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "y")
+    assert _input_in_daemon_thread("proceed? ").result(timeout=1) == "y"
+
+    def interrupted(prompt):
+        assert threading.current_thread().daemon
+        raise EOFError
+
+    monkeypatch.setattr("builtins.input", interrupted)
+    assert isinstance(_input_in_daemon_thread("proceed? ").exception(timeout=1), EOFError)
+
+
+def test_prompt_and_sample_median_of_polled_positions(monkeypatch):
+    entered = threading.Event()
+    monkeypatch.setattr("builtins.input", lambda prompt: entered.wait(0.2) or "")
+    bus = MagicMock()
+    bus.read.return_value = 1234
+
+    assert asyncio.run(prompt_and_sample(bus, "gripper", "Press ENTER", period_s=0.001)) == 1234
+    assert bus.read.call_count >= 5
+
+
+def test_prompt_and_sample_burst_when_entered_early(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+    bus = MagicMock()
+    # One read by the poller before ENTER, then a burst of 5 reads
+    bus.read.side_effect = [500, 1, 2, 3, 4, 5]
+
+    assert asyncio.run(prompt_and_sample(bus, "gripper", "Press ENTER", period_s=10)) == 3
+    assert bus.read.call_count == 6
+
+
+def test_prompt_and_sample_keeps_polled_positions_when_burst_fails(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+    bus = MagicMock()
+    bus.read.side_effect = [500, OSError("No status packet")]
+
+    assert asyncio.run(prompt_and_sample(bus, "gripper", "Press ENTER", period_s=10)) == 500
+
+
+def test_prompt_and_sample_unreadable_motor(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda prompt: "")
+    bus = MagicMock()
+    bus.read.side_effect = OSError("No status packet")
+
+    with pytest.raises(RuntimeError, match="Could not read the position of 'gripper'") as exc_info:
+        asyncio.run(prompt_and_sample(bus, "gripper", "Press ENTER", period_s=10))
+    assert isinstance(exc_info.value.__cause__, OSError)
+
+
+@pytest.fixture
+def gripper_bus() -> MagicMock:
+    bus = MagicMock()
+    bus.motors = {"shoulder_pan": None, "gripper": None}
+    bus.sync_read.return_value = {"shoulder_pan": 2048, "gripper": 1500}
+    return bus
+
+
+@pytest.fixture
+def sampled_positions(monkeypatch):
+    """Positions returned by successive `prompt_and_sample` calls, in raw steps."""
+    positions = []
+
+    async def fake_prompt_and_sample(bus, motor_name, prompt, *args, normalize=True, **kwargs):
+        assert not normalize
+        return positions.pop(0)
+
+    monkeypatch.setattr("lerobot.motors.diagnostics.prompt_and_sample", fake_prompt_and_sample)
+    return positions
+
+
+def test_diagnose_gripper_calibration_zero_difference(gripper_bus, sampled_positions):
+    sampled_positions.extend([1000, 1000])
+
+    result = diagnose_gripper_calibration(gripper_bus)
+
+    assert not result.healthy
+    assert not result.position_changes
+    assert "Position did not change" in result.errors[0]
+    assert sampled_positions == []
+
+
+def test_diagnose_gripper_calibration_small_difference(gripper_bus, sampled_positions):
+    sampled_positions.extend([1000, 1005, 1002, 1003, 1004])
+
+    result = diagnose_gripper_calibration(gripper_bus)
+
+    assert result.healthy
+    assert result.position_range == 5
+    assert result.warnings == ["Very small position difference (5). This may cause calibration issues."]
+    gripper_bus.write.assert_called_once_with("Torque_Enable", "gripper", 1)
+
+
+def test_diagnose_gripper_calibration_out_of_range(gripper_bus, sampled_positions):
+    sampled_positions.extend([1000, 2000, 1500, 3500, 1000])
+
+    result = diagnose_gripper_calibration(gripper_bus)
+
+    assert result.healthy
+    assert (result.zero_position, result.max_position) == (1000, 2000)
+    assert result.warnings == ["Position 3500 calibrates to 250.00% (outside normal range [-10, 110])"]
+
+
+def test_diagnose_gripper_calibration_non_interactive(gripper_bus, sampled_positions):
+    result = diagnose_gripper_calibration(gripper_bus, interactive=False)
+
+    assert result.healthy
+    assert result.position_readable
+    gripper_bus.sync_read.assert_called_once_with(
+        "Present_Position", ["shoulder_pan", "gripper"], normalize=False
+    )
+    gripper_bus.write.assert_not_called()
+
+
+def test_diagnose_gripper_calibration_from_running_loop(gripper_bus, sampled_positions):
+    sampled_positions.extend([1000, 2000, 1500, 1500, 1500])
+
+    async def notebook_cell():
+        return diagnose_gripper_calibration(gripper_bus)
+
+    result = asyncio.run(notebook_cell())
+
+    assert result.healthy
+    assert result.warnings == []
+
+
+@pytest.fixture
+def latency_timer(tmp_path, monkeypatch):
+    """Stand-in for the sysfs `latency_timer` node of the USB-serial adapter, set to the usual 16 ms."""
+    path = tmp_path / "latency_timer"
+    path.write_text("16\n")
+    monkeypatch.setattr("lerobot.motors.diagnostics._latency_timer_path", lambda port: path)
+    return path
+
+
+def test_read_latency_timer(latency_timer):
+    assert read_latency_timer("/dev/ttyUSB0") == 16
+
+    latency_timer.unlink()
+    assert read_latency_timer("/dev/ttyUSB0") is None
+
+
+def test_enable_low_latency(latency_timer, monkeypatch):
+    monkeypatch.setattr("lerobot.motors.diagnostics.sys.platform", "linux")
+    bus = MagicMock()
+
+    assert enable_low_latency(bus)
+
+    bus.port_handler.ser.set_low_latency_mode.assert_called_once_with(True)
+    assert read_latency_timer(bus.port) == 1
+
+
+def test_diagnose_motor_bus_only_warns_about_latency_timer(latency_timer, caplog):
+    bus = MagicMock()
+    bus.motors = {"gripper": None}
+    bus.sync_read.return_value = {"gripper": 50.0}
+
+    batch = diagnose_motor_bus(bus, interactive=False)
+
+    assert batch.all_healthy
+    assert "latency_timer is 16 ms" in caplog.text
+    # The diagnostics leave the adapter settings alone unless asked to
+    assert latency_timer.read_text() == "16\n"
+    bus.port_handler.ser.set_low_latency_mode.assert_not_called()
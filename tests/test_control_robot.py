@@ -14,9 +14,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
-from lerobot.scripts.lerobot_calibrate import CalibrateConfig, calibrate
+import pytest
+
+from lerobot.scripts.lerobot_calibrate import (
+    ROBOT_FAMILIES,
+    CalibrateConfig,
+    _input_with_timeout,
+    calibrate,
+    import_device_configs,
+)
 from lerobot.scripts.lerobot_record import DatasetRecordConfig, RecordConfig, record
 from lerobot.scripts.lerobot_replay import DatasetReplayConfig, ReplayConfig, replay
 from lerobot.scripts.lerobot_teleoperate import TeleoperateConfig, teleoperate
@@ -31,6 +39,75 @@ def test_calibrate():
     calibrate(cfg)
 
 
+ALL_ROBOT_MODULES = {f"lerobot.robots.{family}" for family in ROBOT_FAMILIES.values()}
+
+
+@pytest.mark.parametrize(
+    "args, expected",
+    [
+        (["--robot.type=so100_follower", "--robot.port=/dev/ttyACM0"], {"lerobot.robots.so100_follower"}),
+        (["--teleop.type=homunculus_arm"], {"lerobot.teleoperators.homunculus"}),
+        (["--robot.type", "so100_follower", "--robot.port=/dev/ttyACM0"], ALL_ROBOT_MODULES),
+        (["--robot.type=my_plugin_robot"], ALL_ROBOT_MODULES),
+        (["--diagnose"], set()),
+    ],
+)
+def test_import_device_configs(args, expected):
+    with patch("lerobot.scripts.lerobot_calibrate.importlib.import_module") as import_module:
+        import_device_configs(args)
+
+    assert {call.args[0] for call in import_module.call_args_list} == expected
+
+
+def test_import_device_configs_help_imports_everything():
+    with patch("lerobot.scripts.lerobot_calibrate.importlib.import_module") as import_module:
+        import_device_configs(["--help"])
+
+    imported = {call.args[0] for call in import_module.call_args_list}
+    assert imported >= ALL_ROBOT_MODULES
+    assert "lerobot.teleoperators.so100_leader" in imported
+    assert "lerobot.cameras.opencv.configuration_opencv" in imported
+
+
+def test_input_with_timeout_times_out_on_a_terminal():
+    with (
+        patch("lerobot.scripts.lerobot_calibrate.sys.stdin") as stdin,
+        patch("lerobot.scripts.lerobot_calibrate.select.select", return_value=([], [], [])) as select,
+    ):
+        stdin.isatty.return_value = True
+        assert _input_with_timeout("proceed? ", timeout=0.1) is None
+
+    select.assert_called_once_with([stdin], [], [], 0.1)
+    stdin.readline.assert_not_called()
+
+
+def test_input_with_timeout_reads_pipes_with_input():
+    with (
+        patch("lerobot.scripts.lerobot_calibrate.sys.stdin") as stdin,
+        patch("lerobot.scripts.lerobot_calibrate.select.select") as select,
+        patch("builtins.input", return_value="y") as input_,
+    ):
+        stdin.isatty.return_value = False
+        assert _input_with_timeout("proceed? ", timeout=0.1) == "y"
+
+    select.assert_not_called()
+    input_.assert_called_once_with("proceed? ")
+
+
+def test_calibrate_diagnose_prompt_timeout_aborts_and_disconnects():
+    device = MagicMock()
+    results = MagicMock(all_healthy=True)
+    with (
+        patch("lerobot.scripts.lerobot_calibrate.make_robot_from_config", return_value=device),
+        patch("lerobot.motors.diagnostics.diagnose_motor_bus", return_value=results),
+        patch("lerobot.scripts.lerobot_calibrate._input_with_timeout", return_value=None),
+    ):
+        calibrate(CalibrateConfig(robot=MockRobotConfig(), diagnose=True, diagnose_prompt_timeout=0.1))
+
+    device.calibrate.assert_not_called()
+    device.disconnect.assert_called_once()
+
+
 def test_teleoperate():
     robot_cfg = MockRobotConfig()
     teleop_cfg = MockTeleopConfig()
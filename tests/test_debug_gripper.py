@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from lerobot.scripts import debug_gripper
+
+
+def run_failing_main(argv: list[str]) -> None:
+    bus = MagicMock()
+    bus.connect.side_effect = ConnectionError("No such port")
+    bus.is_connected = False
+    with (
+        patch.object(debug_gripper, "get_follower_bus", return_value=bus),
+        patch("sys.argv", ["debug_gripper", "--port", "/dev/nope", *argv]),
+    ):
+        debug_gripper.main()
+
+
+def test_verbose_prints_traceback(capsys):
+    run_failing_main(["-v"])
+
+    err = capsys.readouterr().err
+    assert "Error during testing: No such port" in err
+    assert "Traceback (most recent call last)" in err
+
+
+def test_traceback_only_with_verbose(capsys):
+    run_failing_main([])
+
+    err = capsys.readouterr().err
+    assert "Error during testing: No such port" in err
+    assert "Traceback" not in err
+
+
+def test_release_bus_after_acknowledged_sync_write():
+    bus = MagicMock()
+    bus.sync_read.return_value = {"shoulder_pan": 0, "gripper": 0}
+
+    debug_gripper.release_bus(bus)
+
+    bus.sync_write.assert_called_once_with("Torque_Enable", 0)
+    bus.disconnect.assert_called_once_with(disable_torque=False)
+
+
+@pytest.mark.parametrize(
+    "sync_read", [{"return_value": {"shoulder_pan": 0, "gripper": 1}}, {"side_effect": OSError("lost")}]
+)
+def test_release_bus_falls_back_to_per_motor_torque_off(sync_read):
+    bus = MagicMock()
+    bus.sync_read.configure_mock(**sync_read)
+
+    debug_gripper.release_bus(bus)
+
+    bus.disconnect.assert_called_once_with()
+    bus.port_handler.closePort.assert_not_called()
+
+
+def test_release_bus_closes_port_when_torque_off_fails():
+    bus = MagicMock()
+    bus.sync_write.side_effect = OSError("port busy")
+    bus.disconnect.side_effect = OSError("port busy")
+
+    debug_gripper.release_bus(bus)
+
+    bus.port_handler.closePort.assert_called_once()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+from lerobot.utils import import_utils
+
+
+def test_register_third_party_plugins_cached(tmp_path, monkeypatch):
+    cache_path = tmp_path / "plugins.json"
+    scans = []
+    imported = []
+
+    def discover():
+        scans.append(1)
+        return ["lerobot_robot_dummy"]
+
+    monkeypatch.setattr(import_utils, "_discover_third_party_plugins", discover)
+    monkeypatch.setattr(import_utils, "_import_third_party_plugins", imported.append)
+
+    import_utils.register_third_party_plugins_cached(cache_path)
+    import_utils.register_third_party_plugins_cached(cache_path)
+
+    assert len(scans) == 1
+    assert imported == [["lerobot_robot_dummy"], ["lerobot_robot_dummy"]]
+
+    # A modified sys.path invalidates the cache
+    cache = json.loads(cache_path.read_text())
+    cache_path.write_text(json.dumps({"key": "stale", "plugins": cache["plugins"]}))
+    import_utils.register_third_party_plugins_cached(cache_path)
+
+    assert len(scans) == 2